@@ -1,29 +1,42 @@
 import asyncio
+import based58
+import heapq
+import httpx
 import logging
+import hyperscan
+import msgspec
 import numba
-import re
-import json
-import time
+import numpy as np
+import uvloop
 import redis.asyncio as redis
-from aiohttp import ClientSession
+from aiohttp import ClientSession, WSMsgType
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import wraps
 from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 from telegram import Update
 from telegram.ext import Application, MessageHandler, filters, CallbackContext
 
 
 def rate_limited(max_calls, period):
     def decorator(func):
-        calls = []
+        calls = deque()
+        lock = asyncio.Lock()
 
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            now = time.time()
-            calls[:] = [t for t in calls if now - t < period]
-            if len(calls) >= max_calls:
-                time.sleep(period - (now - calls[0]))
-            calls.append(time.time())
-            return func(*args, **kwargs)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            # Waiters queue on the lock in FIFO order; only the head sleeps
+            async with lock:
+                now = loop.time()
+                while calls and now - calls[0] >= period:
+                    calls.popleft()
+                if len(calls) >= max_calls:
+                    await asyncio.sleep(period - (now - calls[0]))
+                    calls.popleft()
+                calls.append(loop.time())
+            return await func(*args, **kwargs)
        
         return wrapper   
     return decorator  
@@ -34,20 +47,314 @@ TELEGRAM_BOT_TOKEN = ''
 SOLANA_RPC_URL = ''
 DEXSCREENER_WS_URL = 'wss://io.dexscreener.com/dex/screener/pairs'
 CACHE_TTL = 600  # 10 minutes
+SAFETY_TTL = 60  # seconds a safety verdict is reused
+HISTORY_SIZE = 10  # samples kept per token for trend analysis
+TRACKED_TOKENS = 1024  # initial history capacity, grows geometrically
+TOKEN_WORKERS = 256  # concurrent token pipelines
+HOST_CONNECTIONS = 64  # concurrent requests per upstream host
+OFFLOAD_TEXT_SIZE = 2048  # chars (Telegram caps text at 4096); longer ones go to the pool
+EXTRACT_WORKERS = 1  # the pool only sees the rare long message
+TOKEN_QUEUE_SIZE = 4096  # pending tokens before new mentions are dropped
+CACHE_FLUSH_INTERVAL = 0.05  # seconds between pipelined cache write batches
+WS_MAX_BACKOFF = 60  # seconds, cap for WebSocket reconnect backoff
+ALLOWED_DEX = frozenset(('raydium', 'orca'))
+
+ALERT_TEMPLATE = (
+    "🚨 SOLANA ALERT 🚨\n"
+    "🔗 Address: `{address}`\n"
+    "💰 Price: ${price:.4f}\n"
+    "📈 Score: {score:.2f}/1.0\n"
+    "💧 Liquidity: ${liquidity:,.0f}\n"
+    "[DEX Screener](https://dexscreener.com/solana/{address})"
+)
 USER_CHAT_ID =   # Provide user or group ID
 
+# Base58 candidate scanner, compiled once at import into a Hyperscan DFA.
+# A run only matches together with the byte that ends it (or the end of the
+# buffer), so Hyperscan reports each run once; _scan_tokens cuts runs into
+# 32-44 char tokens
+BASE58_ALPHABET = frozenset(b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
+BASE58_PATTERN = br'[1-9A-HJ-NP-Za-km-z]{32,}(?:[^1-9A-HJ-NP-Za-km-z]|\z)'
+TOKEN_MIN_LEN = 32
+TOKEN_MAX_LEN = 44
+SCAN_DB = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+SCAN_DB.compile(
+    expressions=[BASE58_PATTERN],
+    ids=[0],
+    flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]
+)
+
+
+def _scan_tokens(text):
+    data = text.encode()
+    runs = []
+
+    def on_match(_id, start, end, _flags, _context):
+        # Drop the terminating byte, if any, to get the bare run
+        if data[end - 1] not in BASE58_ALPHABET:
+            end -= 1
+        runs.append((start, end))
+
+    SCAN_DB.scan(data, match_event_handler=on_match)
+
+    # Greedy, non-overlapping split of each run (same result as re.findall)
+    tokens = []
+    for start, end in runs:
+        while end - start >= TOKEN_MIN_LEN:
+            stop = min(start + TOKEN_MAX_LEN, end)
+            tokens.append(data[start:stop].decode())
+            start = stop
+    return tokens
+
+
+def _is_solana_address(token):
+    # Real addresses decode to a 32-byte public key; rejects other Base58 runs
+    try:
+        return len(based58.b58decode(token.encode())) == 32
+    except ValueError:
+        return False
+
+
+def _extract_tokens(text):
+    # Large pasted texts run this in the process pool so they do not stall the event loop
+    tokens = [t for t in dict.fromkeys(_scan_tokens(text)) if _is_solana_address(t)]
+    return tokens[:5]  # Process max 5 tokens per message
+
+
+# Response schemas, decoded straight into typed structs by msgspec
+class Liquidity(msgspec.Struct):
+    usd: float = 0.0
+
+
+class Volume(msgspec.Struct):
+    h24: float = 0.0
+
+
+class PricePoint(msgspec.Struct):
+    priceUsd: float
+
+
+class VolPoint(msgspec.Struct):
+    volume: float
+
+
+class Pair(msgspec.Struct):
+    dexId: str
+    pairAddress: str
+    # Missing for new or illiquid pairs; such pairs are skipped
+    priceUsd: float | None = None
+    liquidity: Liquidity = msgspec.field(default_factory=Liquidity)
+    volume: Volume = msgspec.field(default_factory=Volume)
+    priceHistory: list[PricePoint] = []
+    volumeHistory: list[VolPoint] = []
+
+
+class TokensResponse(msgspec.Struct):
+    pairs: list[Pair] | None = None
+
+
+class WSEnvelope(msgspec.Struct):
+    pairs: list[Pair] = []
+
+
+class PoolLiquidity(msgspec.Struct):
+    liquidity_locked: float = 0.0
+
+
+class TokenMeta(msgspec.Struct):
+    isSlerf: bool = False
+
+
+class RpcResponse(msgspec.Struct):
+    error: dict | None = None
+
+
+# DEX Screener serves prices as strings, so numeric fields are decoded leniently
+PAIR_DECODER = msgspec.json.Decoder(Pair, strict=False)
+TOKENS_DECODER = msgspec.json.Decoder(TokensResponse, strict=False)
+WS_DECODER = msgspec.json.Decoder(WSEnvelope, strict=False)
+POOL_DECODER = msgspec.json.Decoder(PoolLiquidity, strict=False)
+TOKEN_META_DECODER = msgspec.json.Decoder(TokenMeta, strict=False)
+RPC_DECODER = msgspec.json.Decoder(RpcResponse)
+
+ENCODER = msgspec.json.Encoder()
+
+
+# Eager signature: compiled (or loaded from the on-disk cache) at import,
+# so the first analysis never pays JIT latency inside the event loop
+@numba.njit('f4(f4[:], f4[:], i8)', cache=True, fastmath=True, boundscheck=False,
+            error_model='numpy')
+def _analyze_trends_numba(prices, volumes, count):
+    # Numba-optimized calculation over the ring: endpoint changes plus a
+    # least-squares price slope across the whole window
+    size = prices.shape[0]
+    n = min(count, size)
+    if n < 2:
+        return np.float32(0.0)
+    first = count % size if count > size else 0
+    last = (count - 1) % size
+    # error_model='numpy' would turn a zero baseline into inf, not an exception
+    if prices[first] <= 0 or volumes[first] <= 0:
+        return np.float32(0.0)
+
+    # float32 accumulators keep the loop in single precision
+    sx = sy = sxx = sxy = np.float32(0.0)
+    for i in range(n):
+        x = np.float32(i)
+        price = prices[(first + i) % size]
+        sx += x
+        sy += price
+        sxx += x * x
+        sxy += x * price
+    slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+
+    price_change = (prices[last] - prices[first]) / prices[first]
+    # Fitted change across the window, relative to the mean price
+    price_trend = slope * (n - 1) / (sy / n)
+    volume_change = (volumes[last] - volumes[first]) / volumes[first]
+    return (price_change * 0.5) + (price_trend * 0.2) + (volume_change * 0.3)
+
+
 class OptimizedSolanaTradingBot:
     def __init__(self):
         self.session = None
+        self.http = None
+        self.host_limits = defaultdict(lambda: asyncio.Semaphore(HOST_CONNECTIONS))
+        self.telegram = None
+        self.executor = None
         self.redis = None   
         self.ws = None
-        self.jit_analyze = numba.jit(nopython=True)(self._analyze_trends_numba)
+        self.ws_task = None
+        self.fetch_task = None
+        self.flush_task = None
+        # Pair addresses that get mentioned are interned to row ids into
+        # contiguous per-field arrays: one price ring, one volume ring and the
+        # number of pushes per pair.
+        # float32 is plenty for scoring; alerts display the float64 pair price
+        self.addr2id: dict[str, int] = {}
+        self.id2addr: list[str] = []
+        self.prices = np.zeros((TRACKED_TOKENS, HISTORY_SIZE), dtype=np.float32)
+        self.volumes = np.zeros((TRACKED_TOKENS, HISTORY_SIZE), dtype=np.float32)
+        self.counts = np.zeros(TRACKED_TOKENS, dtype=np.int64)
+        self.token_q = None
+        self.workers = []
+        # (key, value, ttl) cache writes waiting for the next pipelined flush
+        self.pending_writes = []
+        # Token pipelines currently running, shared by concurrent mentions
+        self._inflight: dict[str, asyncio.Task] = {}
             
     async def initialize(self):
+        # aiohttp is kept for the WebSocket stream only; REST calls share one HTTP/2 client
         self.session = ClientSession()
-        self.redis = await redis.from_url('redis://localhost:6379', decode_responses=True)
-        self.ws = await self.session.ws_connect(DEXSCREENER_WS_URL)
-        asyncio.create_task(self.fetch_loop())
+        self.executor = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS)
+        self.http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=1024, max_keepalive_connections=256),
+            timeout=httpx.Timeout(5.0)
+        )
+        self.redis = await redis.from_url('redis://localhost:6379')
+        self.ws_task = asyncio.create_task(self._ws_listener())
+        self.fetch_task = asyncio.create_task(self.fetch_loop())
+        self.flush_task = asyncio.create_task(self._flush_loop())
+        self.token_q = asyncio.Queue(maxsize=TOKEN_QUEUE_SIZE)
+        self.workers = [asyncio.create_task(self._worker()) for _ in range(TOKEN_WORKERS)]
+
+    async def _worker(self):
+        while True:
+            token_address, cached_data, safe = await self.token_q.get()
+            try:
+                await self._process_token(token_address, cached_data, safe)
+            except Exception as e:
+                print(f"❌ Błąd w _worker: {e}")
+            finally:
+                self.token_q.task_done()
+
+    async def _ws_listener(self):
+        backoff = 1
+        while True:
+            try:
+                # No permessage-deflate: frames are decoded straight from the raw payload
+                self.ws = await self.session.ws_connect(
+                    DEXSCREENER_WS_URL,
+                    compress=0,
+                    heartbeat=20,
+                    max_msg_size=16 << 20,
+                    receive_timeout=30
+                )
+                backoff = 1
+                async for msg in self.ws:
+                    if msg.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                        continue
+                    try:
+                        update = WS_DECODER.decode(msg.data)
+                    except msgspec.DecodeError as e:
+                        print(f"❌ Błąd w _ws_listener: {e}")
+                        continue
+                    for pair in update.pairs:
+                        if pair.priceUsd is not None:
+                            self._process_ws_update(pair)
+            except Exception as e:
+                print(f"❌ Błąd w _ws_listener: {e}")
+            finally:
+                if self.ws is not None:
+                    await self.ws.close()
+                    self.ws = None
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, WS_MAX_BACKOFF)
+
+    def _process_ws_update(self, pair):
+        # Rings are per pair: one DEX and quote, one volume definition (rolling 24h).
+        # Only pairs that were mentioned have a ring; the rest of the firehose is ignored
+        i = self.addr2id.get(pair.pairAddress)
+        if i is not None:
+            self._push_history(i, pair.priceUsd, pair.volume.h24)
+
+    def _token_id(self, pair_address):
+        i = self.addr2id.get(pair_address)
+        if i is None:
+            i = self.addr2id[pair_address] = len(self.id2addr)
+            self.id2addr.append(pair_address)
+            if i == len(self.counts):
+                self._grow_history()
+        return i
+
+    def _grow_history(self):
+        size = 2 * len(self.counts)
+        for name in ('prices', 'volumes', 'counts'):
+            old = getattr(self, name)
+            new = np.zeros((size,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _push_history(self, i, price, volume):
+        head = self.counts[i]
+        self.prices[i, head % HISTORY_SIZE] = price
+        self.volumes[i, head % HISTORY_SIZE] = volume
+        self.counts[i] = head + 1
+
+    def _cache_set(self, key, value, ttl):
+        self.pending_writes.append((key, value, ttl))
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(CACHE_FLUSH_INTERVAL)
+            await self._flush_pending()
+
+    async def _flush_pending(self):
+        if not self.pending_writes:
+            return
+        writes, self.pending_writes = self.pending_writes, []
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value, ttl in writes:
+                    pipe.set(key, value, ex=ttl)
+                await pipe.execute()
+        except asyncio.CancelledError:
+            # SETs are idempotent; requeue so the final flush in close() resends them
+            self.pending_writes[:0] = writes
+            raise
+        except Exception as e:
+            print(f"❌ Błąd w _flush_loop: {e}")
 
     async def fetch_loop(self):
         while True:
@@ -58,84 +365,163 @@ class OptimizedSolanaTradingBot:
                 print(f"❌ Błąd w fetch_loop: {e}")
             await asyncio.sleep(5)
     async def close(self):  # ⬅️ Zamykamy poprawnie sesję!
-         if self.session:
+        tasks = [t for t in (self.ws_task, self.fetch_task, self.flush_task, *self.workers) if t]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.redis:
+            await self._flush_pending()
+            await self.redis.aclose()
+        if self.http:
+            await self.http.aclose()
+        if self.session:
             await self.session.close()
-               print("✅ Sesja HTTP zamknięta")
+            print("✅ Sesja HTTP zamknięta")
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
              
+    async def _request(self, method, url, **kwargs):
+        # httpx only caps connections globally; bound each upstream host separately
+        async with self.host_limits[urlsplit(url).netloc]:
+            return await self.http.request(method, url, **kwargs)
+
     async def fetch_pair_data(self, pair="SOL/USDC"):
         url = f"https://api.dexscreener.com/latest/dex/search?q={pair}"
-        async with self.session.get(url) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                print(f"Error {response.status}: Unable to fetch data")
-                return None
+        response = await self._request('GET', url)
+        if response.status_code == 200:
+            return TOKENS_DECODER.decode(response.content)
+        else:
+            print(f"Error {response.status_code}: Unable to fetch data")
+            return None
 
     @rate_limited(30, 10)  # 30 calls per 10 seconds
-    async def _get_cached_pair(self, token_address):
-        cached = await self.redis.get(f"solana:pair:{token_address}")
-        if cached:
-            return json.loads(cached)
-
-        async with self.session.get(
-            f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-        ) as resp:
-            data = await resp.json()
-            pair = next((p for p in data['pairs'] if p['dexId'] in {'raydium', 'orca'}), None)
-            if pair:
-                await self.redis.set(
-                    f"solana:pair:{token_address}",
-                    json.dumps(pair),
-                    ex=CACHE_TTL
-                )
-            return pair
+    async def _fetch_pair(self, token_address):
+        resp = await self._request(
+            'GET', f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        )
+        resp.raise_for_status()
+        data = TOKENS_DECODER.decode(resp.content)
+        pair = None
+        for p in data.pairs or ():
+            if p.dexId in ALLOWED_DEX and p.priceUsd is not None:
+                pair = p
+                break
+        if pair:
+            self._cache_set(
+                f"solana:pair:{token_address}".encode(),
+                ENCODER.encode(pair),
+                CACHE_TTL
+            )
+        return pair
 
     async def process_message(self, update: Update, context: CallbackContext):
         text = update.message.text
-        tokens = re.findall(r'[1-9A-HJ-NP-Za-km-z]{32,44}', text)
-            
-        for token in tokens[:5]:  # Process max 5 tokens per message
-            asyncio.create_task(self._process_token(token))
+        if len(text) > OFFLOAD_TEXT_SIZE:
+            loop = asyncio.get_running_loop()
+            tokens = await loop.run_in_executor(self.executor, _extract_tokens, text)
+        else:
+            # Pool round-trip costs far more than scanning an ordinary message
+            tokens = _extract_tokens(text)
+        if not tokens:
+            return
+
+        # One round-trip for every cached pair and safety verdict in the message
+        cached = await self.redis.mget(
+            [f"solana:pair:{t}".encode() for t in tokens] +
+            [f"solana:safe:{t}".encode() for t in tokens]
+        )
+        for token, raw, verdict in zip(tokens, cached, cached[len(tokens):]):
+            pair = PAIR_DECODER.decode(raw) if raw else None
+            safe = None if verdict is None else verdict == b'1'
+            try:
+                self.token_q.put_nowait((token, pair, safe))
+            except asyncio.QueueFull:
+                print(f"Token queue full, dropping {token}")
+
+    async def _process_token(self, token_address, cached_data=None, safe=None):
+        # Singleflight: the first mention owns the work, later ones await it
+        task = self._inflight.get(token_address)
+        if task is None:
+            task = asyncio.create_task(self._do_process_token(token_address, cached_data, safe))
+            self._inflight[token_address] = task
+            task.add_done_callback(lambda _: self._inflight.pop(token_address, None))
+        # Shielded so one cancelled waiter does not cancel the shared work
+        await asyncio.shield(task)
 
-    async def _process_token(self, token_address):
-        cached_data = await self._get_cached_pair(token_address)
+    async def _do_process_token(self, token_address, cached_data, safe):
+        if cached_data is None:
+            cached_data = await self._fetch_pair(token_address)
         if not cached_data:
             return
+        # Start tracking the pair now so the stream fills its ring during the checks
+        self._token_id(cached_data.pairAddress)
 
-        if not await self._safety_checks(token_address):
+        if safe is None:
+            safe = await self._cached_safety_checks(token_address)
+        if not safe:
             return
 
         analysis = await self._perform_analysis(cached_data)
-        if analysis['score'] > 0.8:
+        if np.isfinite(analysis['score']) and analysis['score'] > 0.8:
             await self._send_alert(token_address, analysis)
 
+    async def _cached_safety_checks(self, token_address):
+        safe = await self._safety_checks(token_address)
+        self._cache_set(f"solana:safe:{token_address}".encode(), b'1' if safe else b'0', SAFETY_TTL)
+        return safe
+
     async def _safety_checks(self, token_address):
-        checks = await asyncio.gather(
+        tasks = [asyncio.create_task(c) for c in (
             self._check_holder_distribution(token_address),
             self._check_lp_lock(token_address),
             self._check_slerf_protection(token_address),
             self._simulate_swap(token_address)
-        )
-        return all(checks)
+        )]
+        try:
+            # Conjunctive: the first failing check decides, the rest are cancelled
+            for fut in asyncio.as_completed(tasks):
+                if not await fut:
+                    return False
+            return True
+        finally:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
 
     async def _check_holder_distribution(self, token_address):
         holders = await self._get_holders(token_address)
-        total = sum(h['amount'] for h in holders)
-        return all((h['amount']/total) <= 0.1 for h in holders[:3])
+        # Single pass: running total plus a min-heap of the three largest amounts,
+        # so the result does not depend on the upstream ordering
+        total = 0.0
+        top = []
+        for h in holders:
+            amount = h['amount']
+            total += amount
+            if len(top) < 3:
+                heapq.heappush(top, amount)
+            elif amount > top[0]:
+                heapq.heapreplace(top, amount)
+        return total > 0 and all((amount/total) <= 0.1 for amount in top)
 
     async def _check_lp_lock(self, token_address):
-        async with self.session.get(
-            f"https://api.raydium.io/v2/main/pool/liquidity/{token_address}"
-        ) as resp:
-            data = await resp.json()
-            return data.get('liquidity_locked', 0) > 0
+        resp = await self._request(
+            'GET', f"https://api.raydium.io/v2/main/pool/liquidity/{token_address}"
+        )
+        if resp.status_code == 404:  # no pool
+            return False
+        resp.raise_for_status()
+        data = POOL_DECODER.decode(resp.content)
+        return data.liquidity_locked > 0
 
     async def _check_slerf_protection(self, token_address):
-        async with self.session.get(
-            f"https://api.solscan.io/token/meta?tokenAddress={token_address}"
-        ) as resp:
-            data = await resp.json()
-            return not data.get('isSlerf', False)
+        resp = await self._request(
+            'GET', f"https://api.solscan.io/token/meta?tokenAddress={token_address}"
+        )
+        if resp.status_code == 404:  # unknown token
+            return False
+        resp.raise_for_status()
+        data = TOKEN_META_DECODER.decode(resp.content)
+        return not data.isSlerf
 
     async def _simulate_swap(self, token_address):
         payload = {
@@ -147,38 +533,38 @@ class OptimizedSolanaTradingBot:
                 {"encoding": "jsonParsed"}
             ]
         }
-        async with self.session.post(SOLANA_RPC_URL, json=payload) as resp:
-            result = await resp.json()
-            return not result.get('error')
+        resp = await self._request('POST', SOLANA_RPC_URL, json=payload)
+        # The verdict comes from the JSON-RPC error field; HTTP errors are upstream failures
+        resp.raise_for_status()
+        result = RPC_DECODER.decode(resp.content)
+        return result.error is None
 
     async def _perform_analysis(self, pair_data):
-        prices = [p['priceUsd'] for p in pair_data['priceHistory'][-10:]]
-        volumes = [v['volume'] for v in pair_data['volumeHistory'][-10:]]
+        i = self._token_id(pair_data.pairAddress)
+        if self.counts[i] >= 2:
+            score = _analyze_trends_numba(self.prices[i], self.volumes[i], self.counts[i])
+        else:
+            # Too few stream samples yet: score the snapshot history on its own
+            # instead of mixing its per-point volumes into the stream ring
+            prices = pair_data.priceHistory
+            volumes = pair_data.volumeHistory
+            n = min(len(prices), len(volumes), HISTORY_SIZE)
+            score = _analyze_trends_numba(
+                np.array([p.priceUsd for p in prices[len(prices) - n:]], dtype=np.float32),
+                np.array([v.volume for v in volumes[len(volumes) - n:]], dtype=np.float32),
+                n
+            )
 
         return {
-            'score': self.jit_analyze(prices, volumes),
-            'price': pair_data['priceUsd'],
-            'liquidity': pair_data['liquidity']['usd']
+            'score': score,
+            'price': pair_data.priceUsd,
+            'liquidity': pair_data.liquidity.usd
         }
 
-    @staticmethod
-    def _analyze_trends_numba(prices, volumes):
-        # Numba-optimized calculation 
-        price_change = (prices[-1] - prices[0]) / prices[0]
-        volume_change = (volumes[-1] - volumes[0]) / volumes[0]
-        return (price_change * 0.7) + (volume_change * 0.3)
-
     async def _send_alert(self, token_address, analysis):
-        message = (
-            f"🚨 SOLANA ALERT 🚨\n"
-            f"🔗 Address: `{token_address}`\n"
-            f"💰 Price: ${analysis['price']:.4f}\n"
-            f"📈 Score: {analysis['score']:.2f}/1.0\n"
-            f"💧 Liquidity: ${analysis['liquidity']:,.0f}\n"
-            f"[DEX Screener](https://dexscreener.com/solana/{token_address})"
-        )
+        message = ALERT_TEMPLATE.format(address=token_address, **analysis)
 
-        await context.bot.send_message(
+        await self.telegram.send_message(
             chat_id=USER_CHAT_ID,
             text=message,
             parse_mode='Markdown'
@@ -189,6 +575,7 @@ async def main():
     await bot.initialize()
             
     application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    bot.telegram = application.bot
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, bot.process_message))
 
     await application.start_polling()
@@ -200,4 +587,4 @@ if __name__ == '__main__':
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    asyncio.run(main())
+    uvloop.run(main())